@@ -4,6 +4,7 @@ import base64
 import random
 import string
 import datetime
+import threading
 
 from random import randint
 from typing import Tuple, Optional, Literal, TYPE_CHECKING
@@ -267,32 +268,41 @@ class OauthSession:
         self.callback_url = callback_url
         self.client_id = client_id
         self.client_secret = client_secret
+        self._oauth1: Optional[OAuth1] = None
+        self._oauth1_lock = threading.Lock()
+        self._basic_auth: Optional[str] = None
 
     @property
     def oauth1(self) -> OAuth1:
-        """:class:`Oauth1`: Wrap the credentials in a function that return Oauth1. Usually Uses for Authorization.
+        """:class:`Oauth1`: Wrap the credentials in a function that return Oauth1. Usually Uses for Authorization. The signer is built once on first access and reused afterwards.
 
         .. versionadded:: 1.2.0
         """
-        return OAuth1(
-            self.consumer_key,
-            client_secret=self.consumer_secret,
-            resource_owner_key=self.access_token,
-            resource_owner_secret=self.access_token_secret,
-            callback_uri=self.callback_url,
-            decoding=None,
-        )
+        if self._oauth1 is None:
+            with self._oauth1_lock:
+                if self._oauth1 is None:
+                    self._oauth1 = OAuth1(
+                        self.consumer_key,
+                        client_secret=self.consumer_secret,
+                        resource_owner_key=self.access_token,
+                        resource_owner_secret=self.access_token_secret,
+                        callback_uri=self.callback_url,
+                        decoding=None,
+                    )
+        return self._oauth1
 
     @property
     def basic_auth(self) -> str:
-        """:class:`str`: The decoded base64 encoded client id and secret.
+        """:class:`str`: The decoded base64 encoded client id and secret. Encoded once on first access and reused afterwards.
 
         .. versionadded:: 1.5.0
         """
-        if not self.client_id and not self.client_secret:
-            raise PytweetException("'client_id' and 'client_secret' argument is missing in your client instance!")
+        if self._basic_auth is None:
+            if not self.client_id and not self.client_secret:
+                raise PytweetException("'client_id' and 'client_secret' argument is missing in your client instance!")
 
-        return base64.b64encode(bytes(f"{self.client_id}:{self.client_secret}", "utf-8")).decode()
+            self._basic_auth = base64.b64encode(bytes(f"{self.client_id}:{self.client_secret}", "utf-8")).decode()
+        return self._basic_auth
 
     def invalidate_access_token(self) -> None:
         """Invalidate the access token and access token secret of yout client.
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+__all__ = ("LRUCache", "TTLCache")
+
+
+class LRUCache(OrderedDict):
+    """A thread safe dict that holds at most ``maxsize`` items, the least recently used item is evicted first once it is full.
+
+    .. versionadded:: 1.5.0
+    """
+
+    __slots__ = ("maxsize", "_lock")
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        # Reentrant since get goes through __getitem__.
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                return self[key]
+            except KeyError:
+                return default
+
+    def pop(self, key: Hashable, *default: Any) -> Any:
+        with self._lock:
+            return super().pop(key, *default)
+
+
+class TTLCache:
+    """A thread safe, size bounded cache whose entries expire after a fixed amount of seconds. Least recently used entries are evicted first once the cache is full.
+
+    .. versionadded:: 1.5.0
+    """
+
+    __slots__ = ("maxsize", "ttl", "_data", "_lock")
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def discard_where(self, predicate: Callable[[Any], bool]) -> None:
+        """Remove every entry whose value matches the predicate, expired entries included."""
+        with self._lock:
+            for key in [key for key, (_, value) in self._data.items() if predicate(value)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
@@ -3,7 +3,6 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
-import json
 import logging
 import time
 import threading
@@ -17,7 +16,7 @@ from flask import Flask, request
 from .paginations import MessagePagination
 from .attachments import CTA, CustomProfile, File, Geo, Poll, QuickReply
 from .enums import ReplySetting, SpaceState, Granularity, JobType, JobStatus
-from .constants import TWEET_EXPANSION, USER_FIELD, MEDIA_FIELD, PLACE_FIELD, POLL_FIELD, TWEET_FIELD
+from .constants import TWEET_PARAMS
 from .errors import PytweetException, UnKnownSpaceState
 from .http import HTTPClient
 from .message import DirectMessage, WelcomeMessage, WelcomeMessageRule
@@ -30,6 +29,7 @@ from .dataclass import Location, Trend
 from .list import List as TwitterList
 from .type import ID
 from .compliance import Job
+from .utils import dump_json, load_json
 
 __all__ = ("Client",)
 
@@ -62,9 +62,29 @@ class Client:
     use_bearer_only: bool
         Indicates to only use bearer token for all methods. This mean the client is now a twitter-api-client v2 interface. Some methods are unavailable to use such as fetching trends and location, environment fetching methods, and features such as events. Some methods can be recover with OAuth 2 authorization code flow with PKCE with the correct scopes or permissions. Like users.read scope for reading users info which some methods provide a way like :meth:`Client.fetch_user`.
     sleep_after_ratelimit: :class:`bool`
-        Indicates to sleep when your client is ratelimited, If set to True it won't raise :class:`TooManyRequests` error but it would print a message indicating to sleep, then it sleeps for how many seconds it needs to sleep, after that it continue to restart the request.
+        Indicates to sleep when your client is ratelimited, If set to True it won't raise :class:`TooManyRequests` error but it would print a message indicating to sleep, then it sleeps for how many seconds it needs to sleep, after that it continue to restart the request. If the request is still ratelimited after 5 retries, :class:`TooManyRequests` is raised.
     verify_credentials: :class:`bool`
         Indicates to verify the credentials you specified, this includes consumer_key, consumer_secret, access_token, access_token_secret. make sure to specified all of them in your client, you cannot specified only one of them.
+    connect_timeout: :class:`float`
+        How many seconds to wait for a connection to twitter before giving up on a request, default to 5.
+
+        .. versionadded:: 1.5.0
+    read_timeout: :class:`float`
+        How many seconds to wait for twitter to respond before giving up on a request, default to 30. Media uploads wait at least 120 seconds.
+
+        .. versionadded:: 1.5.0
+    max_retries: :class:`int`
+        How many times to retry a request that failed to connect, timed out or got a 5xx response, default to 3. Only idempotent requests such as GET and DELETE are retried, set it to 0 to disable retries. Ratelimits are handled by sleep_after_ratelimit instead.
+
+        .. versionadded:: 1.5.0
+    message_cache_size: :class:`int`
+        How many direct messages the client keeps cached, default to 1024. The least recently used message is dropped once the cache is full.
+
+        .. versionadded:: 1.5.0
+    tweet_cache_size: :class:`int`
+        How many tweets the client keeps cached, default to 4096. The least recently used tweet is dropped once the cache is full.
+
+        .. versionadded:: 1.5.0
 
     Attributes
     ------------
@@ -94,6 +114,11 @@ class Client:
         use_bearer_only: bool = False,
         sleep_after_ratelimit: bool = False,
         verify_credentials: bool = False,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 3,
+        message_cache_size: int = 1024,
+        tweet_cache_size: int = 4096,
     ) -> None:
         self.http = HTTPClient(
             bearer_token,
@@ -107,6 +132,11 @@ class Client:
             client_secret=client_secret,
             use_bearer_only=use_bearer_only,
             sleep_after_ratelimit=sleep_after_ratelimit,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_retries=max_retries,
+            message_cache_size=message_cache_size,
+            tweet_cache_size=tweet_cache_size,
         )
         self._account_user: Optional[User] = None  # set in account property.
         self.webhook: Optional[Webhook] = None
@@ -120,6 +150,20 @@ class Client:
     def __repr__(self) -> str:
         return "Client({0.account!r})".format(self)
 
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the client's pooled connections to twitter. The client can still be used afterwards, it will open new connections when needed. Using the client as a context manager closes it on exit.
+
+
+        .. versionadded:: 1.5.0
+        """
+        self.http.close()
+
     def account(self, *, update: bool = False) -> Optional[ClientAccount]:
         """Returns :class:`ClientAccount` object which hold the client's informations as a twitter user.
 
@@ -215,9 +259,34 @@ class Client:
 
 
         .. versionadded:: 1.0.0
+
+        .. versionchanged:: 1.5.0
+
+            Fetched users are reused for 5 minutes, use :meth:`Client.invalidate_user` to refetch a user sooner.
         """
         return self.http.fetch_user(user_id)
 
+    def invalidate_user(self, user_id: ID) -> None:
+        """Drops a user from the recently fetched users, the next :meth:`Client.fetch_user` or :meth:`Client.fetch_user_by_username` for that user will make an API call.
+
+        Parameters
+        ------------
+        user_id: :class:`ID`
+            The id of the user to drop.
+
+
+        .. versionadded:: 1.5.0
+        """
+        self.http.invalidate_user(user_id)
+
+    def clear_fetched_users(self) -> None:
+        """Drops every recently fetched user, the next :meth:`Client.fetch_user` or :meth:`Client.fetch_user_by_username` call will make an API call. This does not clear the users from :meth:`Client.get_user`.
+
+
+        .. versionadded:: 1.5.0
+        """
+        self.http.clear_fetched_users()
+
     def fetch_user_by_username(self, username: str) -> Optional[User]:
         """Fetches a twitter user by the user's username.
 
@@ -235,7 +304,17 @@ class Client:
             This method returns a :class:`User` object.
 
 
+        Raises
+        --------
+        ValueError
+            The username is not 1 to 15 letters, digits or underscores.
+
+
         .. versionadded:: 1.0.0
+
+        .. versionchanged:: 1.5.0
+
+            Fetched users are reused for 5 minutes, use :meth:`Client.invalidate_user` to refetch a user sooner. Malformed usernames raise :class:`ValueError` without making a request.
         """
         return self.http.fetch_user_by_username(username)
 
@@ -809,12 +888,7 @@ class Client:
             raise ValueError("start_time or end_time must be a datetime object!")
 
         params = {
-            "expansions": TWEET_EXPANSION,
-            "user.fields": USER_FIELD,
-            "media.fields": MEDIA_FIELD,
-            "place.fields": PLACE_FIELD,
-            "poll.fields": POLL_FIELD,
-            "tweet.fields": TWEET_FIELD,
+            **TWEET_PARAMS,
             "query": query,
             "max_results": max_results,
         }
@@ -881,12 +955,7 @@ class Client:
             raise ValueError("start_time or end_time must be a datetime object!")
 
         params = {
-            "expansions": TWEET_EXPANSION,
-            "user.fields": USER_FIELD,
-            "media.fields": MEDIA_FIELD,
-            "place.fields": PLACE_FIELD,
-            "poll.fields": POLL_FIELD,
-            "tweet.fields": TWEET_FIELD,
+            **TWEET_PARAMS,
             "query": query,
             "max_results": max_results,
         }
@@ -1129,10 +1198,17 @@ class Client:
 
                     response = {"response_token": "sha256=" + format(str(digested)[2:-1])}
 
-                    return json.dumps(response)
+                    return dump_json(response)
+
+                # Decode the raw body ourselves, flask's get_json goes through the slower stdlib json.
+                try:
+                    json_data = load_json(request.get_data())
+                except ValueError:  # Covers empty and malformed bodies, orjson's decode error subclasses it too.
+                    _log.warning("Rejected a webhook request without a valid JSON body.")
+                    return ("", HTTPStatus.BAD_REQUEST)
 
-                json_data = request.get_json()
-                _log.debug(f"An event triggered! {json_data}")
+                if _log.isEnabledFor(logging.DEBUG):
+                    _log.debug(f"An event triggered! {json_data}")
                 self.executor.submit(self.http.handle_events, payload=json_data)
                 return ("", HTTPStatus.OK)
 
@@ -1147,9 +1223,7 @@ class Client:
                 self.environment = env
                 self.environment.add_my_subscription()
                 ids = self.environment.fetch_all_subscriptions()
-                users = self.http.fetch_users(ids)
-                for user in users:
-                    self.http.user_cache[user.id] = user
+                self.http.fetch_users(ids)  # Stores every subscribed user in the user cache.
 
                 _log.debug(
                     f"Listening for events! user cache filled at {len(self.http.user_cache)} users! flask application is running with url: {url}({self.webhook_url_path}).\n Ngrok: {ngrok}\nMake a new webhook when not found: {make_new}\n In Environment: {repr(self.environment)} with webhook: {repr(self.webhook)}."
@@ -1165,9 +1239,7 @@ class Client:
                 time.sleep(sleep_for)
                 self.webhook.trigger_crc()
                 ids = self.environment.fetch_all_subscriptions()
-                users = self.http.fetch_users(ids)
-                for user in users:
-                    self.http.user_cache[user.id] = user
+                self.http.fetch_users(ids)  # Stores every subscribed user in the user cache.
 
                 _log.debug(
                     f"Listening for events! user cache filled at {len(self.http.user_cache)} users! flask application is running with url: {url}({self.webhook_url_path}).\n Ngrok: {ngrok}\nMake a new webhook when not found: {make_new}\n In Environment: {repr(self.environment)} with webhook: {repr(self.webhook)}."
@@ -1228,9 +1300,7 @@ class Client:
             self.environment = env
             self.environment.add_my_subscription()
             ids = self.environment.fetch_all_subscriptions()
-            users = self.http.fetch_users(ids)
-            for user in users:
-                self.http.user_cache[user.id] = user
+            self.http.fetch_users(ids)  # Stores every subscribed user in the user cache.
 
             _log.debug(
                 f"Listening for events! user cache filled at {len(self.http.user_cache)} users! flask application is running with url: {url}({self.webhook_url_path}).\n Ngrok: {ngrok}\nMake a new webhook when not found: {make_new}\n In Environment: {repr(self.environment)} with webhook: {repr(self.webhook)}."
@@ -1244,9 +1314,7 @@ class Client:
         else:
             self.webhook.trigger_crc()
             ids = self.environment.fetch_all_subscriptions()
-            users = self.http.fetch_users(ids)
-            for user in users:
-                self.http.user_cache[user.id] = user
+            self.http.fetch_users(ids)  # Stores every subscribed user in the user cache.
 
             _log.debug(
                 f"Listening for events! user cache filled at {len(self.http.user_cache)} users! flask application is running with url: {url}({self.webhook_url_path}).\n Ngrok: {ngrok}\nMake a new webhook when not found: {make_new}\n In Environment: {repr(self.environment)} with webhook: {repr(self.webhook)}."
@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import datetime
 import requests
-import json
 
 from typing import Optional, List, TYPE_CHECKING
 from .objects import Comparable
-from .utils import time_parse_todt
+from .utils import time_parse_todt, load_json
 from .enums import JobType, JobStatus, JobResultAction, JobResultActionReason
 from .dataclass import JobResult
 
@@ -14,6 +13,9 @@ if TYPE_CHECKING:
     from .http import HTTPClient
     from .type import ID, Payload
 
+# Job files can be large, allow a slow transfer without ever blocking forever.
+_TRANSFER_TIMEOUT = (5.0, 120.0)
+
 
 class Job(Comparable):
     """Represents a job compliance.
@@ -122,7 +124,8 @@ class Job(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        requests.put(self.upload_url, data=open(path_to_filename, "rb"), headers={"Content-Type": "text/plain"})
+        with open(path_to_filename, "rb") as file:
+            requests.put(self.upload_url, data=file, headers={"Content-Type": "text/plain"}, timeout=_TRANSFER_TIMEOUT)
 
     def get_download_result(self) -> Optional[List[JobResult]]:
         """Get the download result of the job. You can only get the result if the job has a `complete` status, check :meth:`Job.status` to check the job's status.
@@ -135,14 +138,14 @@ class Job(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        res = requests.get(self.download_url)
+        res = requests.get(self.download_url, timeout=_TRANSFER_TIMEOUT)
         results = []
         for data in res.text.splitlines():
             if not data:
                 return None
 
             if isinstance(data, str):
-                data = json.loads(data)
+                data = load_json(data)
 
             data["action"] = JobResultAction(data["action"])
             data["reason"] = JobResultActionReason(data["reason"])
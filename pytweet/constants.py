@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 # Expansions & Fields use for extend object data.
 TWEET_EXPANSION = "attachments.poll_ids,attachments.media_keys,author_id,geo.place_id,in_reply_to_user_id,referenced_tweets.id,entities.mentions.username,referenced_tweets.id.author_id"
 SPACE_EXPANSION = "invited_user_ids,speaker_ids,creator_id,host_ids,topic_ids"
@@ -17,6 +19,26 @@ POLL_FIELD = "duration_minutes,end_datetime,id,options,voting_status"
 TOPIC_FIELD = "id,name,description"
 LIST_FIELD = "created_at,follower_count,member_count,private,description,owner_id"
 
+# Query parameters sent by every endpoint that returns these objects. Read-only, so they can be shared between calls.
+USER_PARAMS = MappingProxyType(
+    {"expansions": PINNED_TWEET_EXPANSION, "user.fields": USER_FIELD, "tweet.fields": TWEET_FIELD}
+)
+TWEET_PARAMS = MappingProxyType(
+    {
+        "expansions": TWEET_EXPANSION,
+        "user.fields": USER_FIELD,
+        "media.fields": MEDIA_FIELD,
+        "place.fields": PLACE_FIELD,
+        "poll.fields": POLL_FIELD,
+        "tweet.fields": TWEET_FIELD,
+    }
+)
+LIST_PARAMS = MappingProxyType({"expansions": LIST_EXPANSION, "list.fields": LIST_FIELD, "user.fields": USER_FIELD})
+SPACE_PARAMS = MappingProxyType(
+    {"expansions": SPACE_EXPANSION, "space.fields": SPACE_FIELD, "topic.fields": TOPIC_FIELD, "user.fields": USER_FIELD}
+)
+HOST_SPACE_PARAMS = MappingProxyType({**SPACE_PARAMS, "expansions": COMPLETE_SPACE_FIELD})
+
 # Indicator for the return_when argument in wait_for_futures method.
 FIRST_COMPLETED = "FIRST_COMPLETED"
 FIRST_EXCEPTION = "FIRST_EXCEPTION"
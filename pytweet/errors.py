@@ -1,7 +1,31 @@
+import time
 import requests
+from email.utils import parsedate_to_datetime
 from typing import Optional
 from json import decoder
 
+from .utils import load_json
+
+
+def _retry_after(response: requests.models.Response) -> Optional[float]:
+    # Only looks at the headers, so a ratelimited response can be retried without decoding its body.
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        # Retry-After may also be an HTTP-date.
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+
+    reset = response.headers.get("x-rate-limit-reset")
+    if reset is not None:
+        return max(0.0, int(reset) - time.time())
+    return None
+
 
 class PytweetException(Exception):
     """This is the base class of all exceptions Raise by PyTweet. This inherits :class:`Exception`.
@@ -49,10 +73,12 @@ class HTTPException(PytweetException):
         self.detail = None
         if response is not None:
             try:
-                res = self.response.json()
-                if res.get("errors"):
-                    self.message = res.get("errors")[0].get("message") if not message else message
-                    self.detail = res.get("errors")[0].get("detail")
+                res = load_json(self.response.content)
+                errors = res.get("errors")
+                if errors:
+                    error = errors[0]
+                    self.message = error.get("message") if not message else message
+                    self.detail = error.get("detail")
 
                 else:
                     self.message = res.get("error")
@@ -76,7 +102,8 @@ class HTTPException(PytweetException):
 
     @property
     def status_code(self) -> Optional[int]:
-        if not self.response:
+        # Responses are falsy for error status codes, so compare against None.
+        if self.response is None:
             return None
         return self.response.status_code
 
@@ -124,12 +151,22 @@ class NotFound(HTTPException):
 
 
 class TooManyRequests(HTTPException):
-    """This class inherits :class:`HTTPException`. Raise when ratelimit exceeded and a request return status code 429.
+    """This class inherits :class:`HTTPException`. Raise when ratelimit exceeded and a request return status code 429. The `retry_after` attribute holds how many seconds to wait until the ratelimit resets, or None if the response didn't say.
 
     .. versionadded:: 1.1.0
+
+    .. versionchanged:: 1.5.0
+
+        Added the `retry_after` attribute.
     """
 
-    pass
+    def __init__(
+        self,
+        response: Optional[requests.models.Response] = None,
+        message: str = None,
+    ):
+        super().__init__(response, message)
+        self.retry_after: Optional[float] = _retry_after(response) if response is not None else None
 
 
 class ConnectionException(HTTPException):
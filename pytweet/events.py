@@ -1,4 +1,5 @@
 import datetime
+from types import MappingProxyType
 from typing import Union, Optional
 from .user import User
 from .tweet import Tweet
@@ -6,6 +7,8 @@ from .enums import ActionEventType, UserActionEventType
 from .type import Payload
 from .utils import time_parse_todt
 
+_EMPTY = MappingProxyType({})  # Read-only default for optional payload sections.
+
 # Events type
 
 
@@ -18,7 +21,7 @@ class Event:
     __slots__ = ("_payload", "_type")
 
     def __init__(self, data: Payload):
-        self._type = list(data.keys())[1]
+        self._type = list(data)[1]
         self._payload = data.get(self._type)[0]
 
     @property
@@ -99,7 +102,7 @@ class DirectMessageEvent(Event):
 
         .. versionadded:: 1.5.0
         """
-        return self.payload.get("target", {}).get("recipient")
+        return self.payload.get("target", _EMPTY).get("recipient")
 
     @property
     def sender(self) -> User:
@@ -107,7 +110,7 @@ class DirectMessageEvent(Event):
 
         .. versionadded:: 1.5.0
         """
-        return self.payload.get("target", {}).get("sender", None)
+        return self.payload.get("target", _EMPTY).get("sender")
 
 
 # Events
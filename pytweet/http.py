@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import collections
 import io
 import logging
+import random
+import re
 import sys
+import threading
 import time
 import requests
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
-from typing import Any, List, NoReturn, Optional, Union, TYPE_CHECKING
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, List, NoReturn, Optional, Tuple, Union, TYPE_CHECKING
 
 from .attachments import CTA, CustomProfile, File, Geo, Poll, QuickReply
 from .auth import OauthSession
@@ -23,24 +31,21 @@ from .errors import (
     UnauthorizedForResource,
     ResourceNotFound,
     DisallowedResource,
+    _retry_after,
 )
 from .constants import (
-    TWEET_EXPANSION,
     SPACE_EXPANSION,
-    LIST_EXPANSION,
-    PINNED_TWEET_EXPANSION,
-    MEDIA_FIELD,
-    PLACE_FIELD,
-    POLL_FIELD,
     SPACE_FIELD,
     COMPLETE_SPACE_FIELD,
-    TWEET_FIELD,
     COMPLETE_TWEET_FIELD,
     TWEET_FIELD_WITH_ORGANIC_METRICS,
     TWEET_FIELD_WITH_PROMOTED_METRICS,
-    USER_FIELD,
     TOPIC_FIELD,
-    LIST_FIELD,
+    USER_PARAMS,
+    TWEET_PARAMS,
+    LIST_PARAMS,
+    SPACE_PARAMS,
+    HOST_SPACE_PARAMS,
 )
 from .message import DirectMessage, WelcomeMessage, WelcomeMessageRule
 from .parser import EventParser
@@ -51,15 +56,127 @@ from .threads import ThreadManager
 from .relations import RelationUpdate
 from .list import List as TwitterList
 from .compliance import Job
+from .cache import LRUCache, TTLCache
+from .utils import HAS_ORJSON, dump_json, load_json
 
 if TYPE_CHECKING:
     from .type import ID, Payload, ResponsePayload
     from .stream import Stream
 
 _log = logging.getLogger(__name__)
+# Uploads and thread sessions fan out across worker threads, keep enough pooled connections for them to reuse.
+_POOL_MAXSIZE = 32
+_USER_AGENT = "Py-Tweet (https://github.com/PyTweet/PyTweet/) Python/{0[0]}.{0[1]}.{0[2]} requests/{1}".format(
+    sys.version_info, requests.__version__
+)
+_UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024  # Twitter accepts media segments of up to 5MB.
+_UPLOAD_WORKERS = 4
+_FANOUT_WORKERS = 10
+_UPLOAD_READ_TIMEOUT = 120
+_MEDIA_PROCESSING_TIMEOUT = 600  # Seconds to keep polling the STATUS command before giving up.
+# Tweets and messages are cached as they are seen, bound them so long running clients don't grow forever.
+_MESSAGE_CACHE_MAXSIZE = 1024
+_TWEET_CACHE_MAXSIZE = 4096
+# fetch_user results are reused for a few minutes so hydrating the same users (e.g. in DMs) doesn't refetch them.
+_FETCHED_USERS_MAXSIZE = 512
+_FETCHED_USERS_TTL = 300
+_USERNAME_RE = re.compile(r"[A-Za-z0-9_]{1,15}\Z")  # The username pattern of the v2 users lookup endpoint.
+_USERS_LOOKUP_LIMIT = 100  # Maximum amount of ids the users lookup endpoint accepts per request.
+# Read-only query parameters for fetch_tweet, keyed by (organic_metrics, promoted_metrics).
+_TWEET_PARAMS = MappingProxyType(
+    {
+        (False, False): TWEET_PARAMS,
+        (True, False): MappingProxyType({**TWEET_PARAMS, "tweet.fields": TWEET_FIELD_WITH_ORGANIC_METRICS}),
+        (False, True): MappingProxyType({**TWEET_PARAMS, "tweet.fields": TWEET_FIELD_WITH_PROMOTED_METRICS}),
+        (True, True): MappingProxyType({**TWEET_PARAMS, "tweet.fields": COMPLETE_TWEET_FIELD}),
+    }
+)
+# Keyed by space_host.
+_SPACE_PARAMS = MappingProxyType({False: SPACE_PARAMS, True: HOST_SPACE_PARAMS})
+_HTTP_METHODS = frozenset(("GET", "POST", "PUT", "PATCH", "DELETE"))
+_NO_CONTENT_CHECK_CODES = frozenset((201, 202, 204))
+_RATELIMIT_CODES = frozenset((420, 429))  # 420 status code is an unofficial extension by Twitter.
+_RATELIMIT_BACKOFF_CAP = 900  # Twitter's ratelimit windows are 15 minutes long.
+_RATELIMIT_MAX_RETRIES = 5  # A ratelimit normally lifts after one wait for the reset, give up if it keeps coming back.
+_STATUS_EXCEPTIONS = {
+    400: BadRequests,
+    401: Unauthorized,
+    403: Forbidden,
+    404: NotFound,
+    409: Conflict,
+    431: FieldsTooLarge,
+    **dict.fromkeys(_RATELIMIT_CODES, TooManyRequests),
+}
+
+
+def _parse_json(response: requests.Response) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep catching the stdlib error.
+    if not HAS_ORJSON:
+        return response.json()
+    return load_json(response.content)
+
+
+_API_ERROR_EXCEPTIONS = {
+    "https://api.twitter.com/2/problems/not-authorized-for-resource": UnauthorizedForResource,
+    "https://api.twitter.com/2/problems/resource-not-found": ResourceNotFound,
+    "https://api.twitter.com/2/problems/disallowed-resource": DisallowedResource,
+}
+
+
+def _check_api_errors(res: Payload) -> None:
+    # A successful response can still carry errors, e.g. partial errors from expansions.
+    errors = res.get("errors")
+    if not errors:
+        return
+
+    error = errors[0]
+    exception = _API_ERROR_EXCEPTIONS.get(error.get("type"))  # Only v2 errors have a type.
+    if exception is None:
+        return
+
+    if exception is UnauthorizedForResource and error.get("parameter") == "pinned_tweet_id":
+        return
+
+    if exception is ResourceNotFound and res.get("data") is not None:
+        return
+
+    raise exception(error["detail"])
 
 
 class HTTPClient:
+    __slots__ = (
+        "credentials",
+        "_missing_credential",
+        "__session",
+        "base_url",
+        "upload_url",
+        "bearer_token",
+        "consumer_key",
+        "consumer_secret",
+        "access_token",
+        "access_token_secret",
+        "my_id",
+        "stream",
+        "callback_url",
+        "client_id",
+        "client_secret",
+        "_auth",
+        "use_bearer_only",
+        "event_parser",
+        "payload_parser",
+        "thread_manager",
+        "_fanout_executor",
+        "_fanout_lock",
+        "sleep_after_ratelimit",
+        "timeout",
+        "current_header",
+        "message_cache",
+        "tweet_cache",
+        "user_cache",
+        "_fetched_users",
+        "events",
+    )
+
     def __init__(
         self,
         bearer_token: str,
@@ -74,6 +191,11 @@ class HTTPClient:
         client_secret: Optional[str] = None,
         use_bearer_only: bool = False,
         sleep_after_ratelimit: bool = False,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 3,
+        message_cache_size: int = _MESSAGE_CACHE_MAXSIZE,
+        tweet_cache_size: int = _TWEET_CACHE_MAXSIZE,
     ):
         self.credentials = {
             "bearer_token": bearer_token,
@@ -97,7 +219,31 @@ class HTTPClient:
             if not isinstance(v, (str, type(None))):
                 raise Unauthorized(None, f"Wrong authorization passed for credential: {k}.")
 
+        # Credentials never change after construction, so resolve the first missing one once instead of per request.
+        self._missing_credential = next((k for k, v in self.credentials.items() if v is None), None)
+
         self.__session = requests.Session()
+        # Headers sent with every request are set once on the session, requests merges the per-call ones on top.
+        self.__session.headers["User-Agent"] = _USER_AGENT
+        self.__session.headers["Authorization"] = f"Bearer {bearer_token}"
+        self.__session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_maxsize=_POOL_MAXSIZE,
+                # Executors run up to 100 requests at once, wait for a pooled connection instead of opening
+                # throwaway ones that are discarded, TLS handshake and all, as soon as the pool is full.
+                pool_block=True,
+                # Only idempotent methods are retried, the final response is handed back to request() to raise on.
+                # Retry-After is ignored here so ratelimits always reach request() and its sleep_after_ratelimit check.
+                max_retries=Retry(
+                    total=max_retries,
+                    backoff_factor=0.3,
+                    status_forcelist=(500, 502, 503, 504),
+                    raise_on_status=False,
+                    respect_retry_after_header=False,
+                ),
+            ),
+        )
         self.base_url = "https://api.twitter.com/"
         self.upload_url = "https://upload.twitter.com/"
         self.bearer_token = bearer_token
@@ -105,6 +251,8 @@ class HTTPClient:
         self.consumer_secret = consumer_secret
         self.access_token = access_token
         self.access_token_secret = access_token_secret
+        # The access token is prefixed with the id of the user it belongs to.
+        self.my_id = access_token.partition("-")[0] if access_token else None
         self.stream = stream
         self.callback_url = callback_url
         self.client_id = client_id
@@ -120,15 +268,20 @@ class HTTPClient:
             client_secret=self.client_secret,
         )
         self.use_bearer_only = use_bearer_only
-        self.event_parser = EventParser(self)
-        self.payload_parser = self.event_parser.payload_parser
         self.thread_manager = ThreadManager()
+        self._fanout_executor = None
+        self._fanout_lock = threading.Lock()
         self.sleep_after_ratelimit = sleep_after_ratelimit
+        self.timeout = (connect_timeout, read_timeout)
         self.current_header = None
-        self.message_cache = {}
-        self.tweet_cache = {}
+        self.message_cache = LRUCache(message_cache_size)
+        self.tweet_cache = LRUCache(tweet_cache_size)
         self.user_cache = {}
+        self._fetched_users = TTLCache(_FETCHED_USERS_MAXSIZE, _FETCHED_USERS_TTL)
         self.events = {}
+        # EventParser may call fetch_me when there is no access token, so everything request() reads must be set first.
+        self.event_parser = EventParser(self)
+        self.payload_parser = self.event_parser.payload_parser
         if self.stream:
             self.stream.http_client = self
             self.stream.connection.http_client = self
@@ -141,12 +294,39 @@ class HTTPClient:
     def oauth_session(self) -> OauthSession:
         return self._auth
 
+    @property
+    def fanout_executor(self) -> ThreadPoolExecutor:
+        # Shared by methods that send one request per item, so they reuse warm threads instead of spawning a pool per call.
+        # Built on first use, and built again if close() has shut the previous one down.
+        with self._fanout_lock:
+            if self._fanout_executor is None:
+                self._fanout_executor = ThreadPoolExecutor(
+                    max_workers=_FANOUT_WORKERS, thread_name_prefix="fanout-request"
+                )
+            return self._fanout_executor
+
+    def __enter__(self) -> HTTPClient:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._fanout_lock:
+            executor, self._fanout_executor = self._fanout_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.__session.close()
+
     def dispatch(self, event_name: str, *args: Any, **kwargs: Any) -> Any:
         event = self.events.get(event_name)
         if not event:
             return None
 
-        _log.debug(f"Dispatching Event: on_{event_name}" f"Positional-Arguments: {args}" f"Keyword-Arguments: {kwargs}")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                f"Dispatching Event: on_{event_name}" f"Positional-Arguments: {args}" f"Keyword-Arguments: {kwargs}"
+            )
         return event(*args, **kwargs)
 
     def request(
@@ -155,38 +335,33 @@ class HTTPClient:
         version: str,
         path: str,
         *,
-        headers: Payload = {},
-        params: Payload = {},
-        json: Payload = {},
-        data: Payload = {},
-        files: Payload = {},
+        headers: Optional[Payload] = None,
+        params: Optional[Payload] = None,
+        json: Optional[Payload] = None,
+        data: Optional[Payload] = None,
+        files: Optional[Payload] = None,
         auth: bool = False,
         basic_auth: bool = False,
         thread_name: Optional[str] = None,
         thread_session: bool = False,
         use_base_url: bool = True,
         is_json: bool = True,
+        timeout: Optional[Tuple[float, float]] = None,
     ) -> ResponsePayload:
         if use_base_url:
             url = self.base_url + version + path
         else:
             url = self.upload_url + version + path
 
-        user_agent = "Py-Tweet (https://github.com/PyTweet/PyTweet/) Python/{0[0]}.{0[1]}.{0[2]} requests/{1}"
-        if "Authorization" not in headers.keys():
-            headers["Authorization"] = f"Bearer {self.bearer_token}"
-
-        headers["User-Agent"] = user_agent.format(sys.version_info, requests.__version__)
-
         if not self.use_bearer_only:
             if auth:
+                if self._missing_credential:
+                    raise PytweetException(f"{self._missing_credential} is a required credential for authorization.")
                 auth = self.oauth_session.oauth1
-                for k, v in self.credentials.items():
-                    if v is None:
-                        raise PytweetException(f"{k} is a required credential for authorization.")
 
             if basic_auth:
-                headers["Authorization"] = f"Basic {self.oauth_session.basic_auth}"
+                # Never mutate the caller's headers.
+                headers = {**(headers or {}), "Authorization": f"Basic {self.oauth_session.basic_auth}"}
 
         else:
             auth = None
@@ -199,6 +374,9 @@ class HTTPClient:
             data = None
 
         method = method.upper()
+        if method not in _HTTP_METHODS:
+            raise TypeError(f"Unsupported HTTP method: {method!r}")
+
         if thread_session:
             executor = self.thread_manager.create_new_executor(thread_name=thread_name, session_id=thread_session)
             future = executor.submit(
@@ -212,36 +390,71 @@ class HTTPClient:
                 json=json,
                 files=files,
                 auth=auth,
+                use_base_url=use_base_url,
+                is_json=is_json,
+                timeout=timeout,
             )
             return future
 
         else:
-            response = self.__session.request(
-                method,
-                url,
-                headers=headers,
-                params=params,
-                data=data,
-                json=json,
-                files=files,
-                auth=auth,
-            )
+            request_headers = headers
+            body = data
+            # requests serializes any json that is not None, keep an empty payload from becoming a "{}" body.
+            json_body = json or None
+            if json and HAS_ORJSON:
+                # Serialize the body ourselves so requests doesn't go through the slower stdlib json.dumps.
+                request_headers = {**(headers or {}), "Content-Type": "application/json"}
+                body = dump_json(json)
+                json_body = None
+
+            for attempt in range(_RATELIMIT_MAX_RETRIES + 1):
+                response = self.__session.request(
+                    method,
+                    url,
+                    headers=request_headers,
+                    params=params,
+                    data=body,
+                    json=json_body,
+                    files=files,
+                    auth=auth,
+                    timeout=timeout or self.timeout,
+                )
+                if (
+                    response.status_code not in _RATELIMIT_CODES
+                    or not self.sleep_after_ratelimit
+                    or attempt == _RATELIMIT_MAX_RETRIES
+                ):
+                    break
+
+                # Wait for the ratelimit reset when twitter tells us, otherwise back off exponentially. The jitter
+                # keeps requests that got ratelimited together from all retrying at the same moment.
+                retry_after = _retry_after(response)
+                if retry_after is None:
+                    retry_after = min(2**attempt, _RATELIMIT_BACKOFF_CAP)
+
+                sleep_for = retry_after + 1 + random.random()
+                _log.warning(f"Client is ratelimited. Sleeping for {sleep_for:.2f}")
+                print(f"Client is ratelimited. Sleeping for {sleep_for:.2f}")
+                time.sleep(sleep_for)
+
             code = response.status_code
             self.current_header = response.headers
             res = None
-            _log.debug(
-                f"{method} {url} has returned: "
-                f"{response.status_code} {response.reason}\n"
-                f"Headers: {response.headers}\n"
-                f"Content: {response.content}\n"
-                f"Json-payload: {json}\n"
-                f"Parameters: {params}\n"
-            )
+            # Formatting the whole response is costly, only do it when someone is listening.
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug(
+                    f"{method} {url} has returned: "
+                    f"{response.status_code} {response.reason}\n"
+                    f"Headers: {response.headers}\n"
+                    f"Content: {response.content}\n"
+                    f"Json-payload: {json}\n"
+                    f"Parameters: {params}\n"
+                )
 
-            if code in (201, 202, 204):
+            if code in _NO_CONTENT_CHECK_CODES:
                 if is_json:
                     try:
-                        res = response.json()
+                        res = _parse_json(response)
                     except JSONDecodeError:
                         return response.text
                 else:
@@ -249,75 +462,23 @@ class HTTPClient:
 
                 return res
 
-            elif code == 400:
-                raise BadRequests(response)
-
-            elif code == 401:
-                raise Unauthorized(response)
-
-            elif code == 403:
-                raise Forbidden(response)
-
-            elif code == 404:
-                raise NotFound(response)
-
-            elif code == 409:
-                raise Conflict(response)
-
-            elif code in (420, 429):  # 420 status code is an unofficial extension by Twitter.
-                if self.sleep_after_ratelimit:
-                    remaining = int(response.headers["x-rate-limit-reset"])
-                    sleep_for = (remaining - int(time.time())) + 1
-                    _log.warn(f"Client is ratelimited. Sleeping for {sleep_for}")
-                    print(f"Client is ratelimited. Sleeping for {sleep_for}")
-                    time.sleep(sleep_for)
-                    return self.request(
-                        method,
-                        version,
-                        path,
-                        headers=headers,
-                        params=params,
-                        data=data,
-                        json=json,
-                        files=files,
-                        auth=auth,
-                    )
-
-                else:
-                    raise TooManyRequests(response)
-
-            elif code == 431:
-                raise FieldsTooLarge(response)
+            exception = _STATUS_EXCEPTIONS.get(code)
+            if exception:
+                raise exception(response)
 
             if is_json:
                 try:
-                    res = response.json()
+                    res = _parse_json(response)
                 except JSONDecodeError:
                     res = response.text
             else:
                 return response.text
 
             if isinstance(res, dict):
-                if res.get("errors"):
-                    error = res["errors"][0]
-                    if error["type"] == "https://api.twitter.com/2/problems/not-authorized-for-resource":
-                        if not error["parameter"] == "pinned_tweet_id":
-                            raise UnauthorizedForResource(error["detail"])
-                    elif (
-                        error["type"] == "https://api.twitter.com/2/problems/resource-not-found"
-                        and res.get("data", None) is None
-                    ):
-                        raise ResourceNotFound(error["detail"])
-
-                    elif error["type"] == "https://api.twitter.com/2/problems/disallowed-resource":
-                        raise DisallowedResource(error["detail"])
-
-                if "meta" in res.keys():
-                    try:
-                        if res["meta"]["result_count"] == 0:
-                            return []
-                    except KeyError:
-                        pass
+                _check_api_errors(res)
+                meta = res.get("meta")
+                if meta and meta.get("result_count") == 0:
+                    return []
 
             return res
 
@@ -326,33 +487,35 @@ class HTTPClient:
         thread_session = self.thread_manager.generate_thread_session()
 
         def check_status(processing_info, media_id):
-            if not processing_info:
-                return
-
-            state = processing_info["state"]
-            seconds = processing_info.get("check_after_secs")
-            if seconds is None:
-                return None
-
-            if state == "succeeded":
-                return
-
-            if state == "failed":
-                raise PytweetException(f"Failed to finalize Media!\n{processing_info}")
+            deadline = time.monotonic() + _MEDIA_PROCESSING_TIMEOUT
+            while processing_info:
+                state = processing_info["state"]
+                if state == "succeeded":
+                    return
+
+                if state == "failed":
+                    raise PytweetException(f"Failed to finalize Media!\n{processing_info}")
+
+                seconds = processing_info.get("check_after_secs")
+                if seconds is None:
+                    return
+
+                if time.monotonic() + seconds > deadline:
+                    raise PytweetException(
+                        f"Media is still processing after {_MEDIA_PROCESSING_TIMEOUT} seconds!\n{processing_info}"
+                    )
 
-            time.sleep(seconds)
+                time.sleep(seconds)
 
-            res = self.request(
-                "GET",
-                version="1.1",
-                path="/media/upload.json",
-                params={"command": "STATUS", "media_id": media_id},
-                auth=True,
-                use_base_url=False,
-            )
-
-            processing_info = res.get("processing_info", None)
-            check_status(processing_info, media_id)
+                res = self.request(
+                    "GET",
+                    version="1.1",
+                    path="/media/upload.json",
+                    params={"command": "STATUS", "media_id": media_id},
+                    auth=True,
+                    use_base_url=False,
+                )
+                processing_info = res.get("processing_info", None)
 
         if command.upper() == "INIT":
             data = {
@@ -376,18 +539,13 @@ class HTTPClient:
             return res["media_id"]
 
         elif command.upper() == "APPEND":
-            segment_id = 0
-            bytes_sent = 0
-            path = file.path
-            if isinstance(path, io.IOBase):
-                open_file = path
-            else:
-                open_file = open(path, "rb")
-
             if not file.media_id:
                 raise ValueError("'media_id' is None! Please specified it.")
 
-            while bytes_sent < file.total_bytes:
+            # Twitter can take a while to acknowledge a large segment, give it more time than a regular request.
+            append_timeout = (self.timeout[0], max(self.timeout[1], _UPLOAD_READ_TIMEOUT))
+
+            def append_segment(segment_id: int, segment: bytes):
                 self.request(
                     "POST",
                     version="1.1",
@@ -397,13 +555,43 @@ class HTTPClient:
                         "media_id": file.media_id,
                         "segment_index": segment_id,
                     },
-                    files={"media": open_file.read(4 * 1024 * 1024)},
+                    files={"media": segment},
                     auth=True,
                     use_base_url=False,
+                    timeout=append_timeout,
                 )
 
-                bytes_sent = open_file.tell()
-                segment_id += 1
+            segment_id = 0
+            bytes_sent = 0
+            path = file.path
+            owns_file = not isinstance(path, io.IOBase)
+            open_file = open(path, "rb") if owns_file else path
+            # Segments carry their own index, so they can be sent concurrently. Reading stays sequential and the
+            # number of in-flight segments is capped so large files are never fully buffered in memory.
+            executor = self.thread_manager.create_new_executor(
+                max_workers=_UPLOAD_WORKERS, thread_name="media-append-request", session_id=thread_session
+            )
+            pending = collections.deque()
+
+            try:
+                while bytes_sent < file.total_bytes:
+                    segment = open_file.read(_UPLOAD_CHUNK_SIZE)
+                    if not segment:
+                        break
+
+                    if len(pending) >= _UPLOAD_WORKERS:
+                        pending.popleft().result()
+
+                    pending.append(executor.submit(append_segment, segment_id, segment))
+                    bytes_sent = open_file.tell()
+                    segment_id += 1
+
+                for future in pending:
+                    future.result()
+            finally:
+                executor.shutdown(wait=True)
+                if owns_file:
+                    open_file.close()
 
         elif command.upper() == "FINALIZE":
             executor = self.thread_manager.create_new_executor(thread_name="subfiles-upload-request")
@@ -491,105 +679,104 @@ class HTTPClient:
             "GET",
             "2",
             f"/users/me",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
             auth=True,
         )
 
-        return User(data, http_client=self)
+        user = User(data, http_client=self)
+        self._cache_fetched_user(user)
+        return user
 
-    def fetch_user(self, user_id: ID) -> Optional[User]:
-        try:
-            int(user_id)
-        except ValueError:
-            raise ValueError("user_id must be an int, or a string of digits!")
+    def _cache_fetched_user(self, user: User) -> None:
+        self.user_cache[user.id] = user
+        self._fetched_users[user.id] = user
+        self._fetched_users[user.username.lower()] = user
 
+    def _fetch_user(self, key: ID, *, by: str = "id") -> Optional[User]:
+        cache_key = key if by == "id" else key.lower()
+        user = self._fetched_users.get(cache_key)
+        if user is not None:
+            return user
+
+        path = f"/users/{key}" if by == "id" else f"/users/by/username/{key}"
         data = self.request(
             "GET",
             "2",
-            f"/users/{user_id}",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            path,
+            params=USER_PARAMS,
             auth=True,
         )
+        user = User(data, http_client=self)
+        self._cache_fetched_user(user)
+        return user
 
-        return User(data, http_client=self)
+    def invalidate_user(self, user_id: ID) -> None:
+        # The user is cached under its id and its username, and either key may have outlived the other.
+        user_id = int(user_id)
+        self._fetched_users.discard_where(lambda user: user.id == user_id)
+
+    def clear_fetched_users(self) -> None:
+        self._fetched_users.clear()
+
+    def fetch_user(self, user_id: ID) -> Optional[User]:
+        try:
+            user_id = int(user_id)
+        except ValueError:
+            raise ValueError("user_id must be an int, or a string of digits!")
+
+        return self._fetch_user(user_id, by="id")
 
     def fetch_users(self, ids: List[ID]) -> List[User]:
-        str_ids = []
+        # Keyed by id so duplicates are only looked up once while the caller's order is kept.
+        users = {}
         for id in ids:
-            try:
-                int(id)
-            except ValueError as e:
-                raise e
-            else:
-                str_ids.append(str(id))
+            id = int(id)
+            users[id] = self._fetched_users.get(id)
 
-        res = self.request(
-            "GET",
-            "2",
-            f"/users?ids={','.join(str_ids)}",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
-            auth=True,
-        )
-
-        users = [User(data, http_client=self) for data in res["data"]]
-        for user in users:
-            self.user_cache[user.id] = user
-        return users
+        missing = [str(id) for id, user in users.items() if user is None]
+        for i in range(0, len(missing), _USERS_LOOKUP_LIMIT):
+            res = self.request(
+                "GET",
+                "2",
+                "/users",
+                params={"ids": ",".join(missing[i : i + _USERS_LOOKUP_LIMIT]), **USER_PARAMS},
+                auth=True,
+            )
+            # The batch shares one includes block, give every user its own pinned tweet so it matches fetch_user.
+            pinned_tweets = {tweet["id"]: tweet for tweet in (res.get("includes") or {}).get("tweets", ())}
+            for data in res.get("data", []):
+                pinned_tweet = pinned_tweets.get(data.get("pinned_tweet_id"))
+                if pinned_tweet is not None:
+                    data = {"data": data, "includes": {"tweets": [pinned_tweet]}}
+                user = User(data, http_client=self)
+                self._cache_fetched_user(user)
+                users[user.id] = user
+
+        # Suspended or deleted accounts are left out of the response, skip them like before.
+        return [user for user in users.values() if user is not None]
 
     def fetch_user_by_username(self, username: str) -> Optional[User]:
         if username.startswith("@"):
-            username = username.replace("@", "", 1)
+            username = username[1:]
 
-        data = self.request(
-            "GET",
-            "2",
-            f"/users/by/username/{username}",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
-            auth=True,
-        )
-        user = User(data, http_client=self)
-        self.user_cache[user.id] = user
-        return user
+        if not _USERNAME_RE.match(username):
+            raise ValueError("username must be 1 to 15 letters, digits or underscores!")
+
+        return self._fetch_user(username, by="username")
 
     def fetch_tweet(
         self, tweet_id: ID, *, organic_metrics: bool = False, promoted_metrics: bool = False
     ) -> Optional[Tweet]:
-        field = TWEET_FIELD
-        if organic_metrics and promoted_metrics:
-            field = COMPLETE_TWEET_FIELD
-        elif organic_metrics:
-            field = TWEET_FIELD_WITH_ORGANIC_METRICS
-        elif promoted_metrics:
-            field = TWEET_FIELD_WITH_PROMOTED_METRICS
+        try:
+            tweet_id = int(tweet_id)
+        except ValueError:
+            raise ValueError("tweet_id must be an int, or a string of digits!")
 
         res = self.request(
             "GET",
             "2",
             f"/tweets/{tweet_id}",
-            params={
-                "tweet.fields": field,
-                "user.fields": USER_FIELD,
-                "expansions": TWEET_EXPANSION,
-                "media.fields": MEDIA_FIELD,
-                "place.fields": PLACE_FIELD,
-                "poll.fields": POLL_FIELD,
-            },
+            params=_TWEET_PARAMS[bool(organic_metrics), bool(promoted_metrics)],
             auth=True,
         )
 
@@ -602,12 +789,7 @@ class HTTPClient:
             "GET",
             "2",
             f"/spaces/{str(space_id)}",
-            params={
-                "expansions": SPACE_EXPANSION if not space_host else COMPLETE_SPACE_FIELD,
-                "space.fields": SPACE_FIELD,
-                "topic.fields": TOPIC_FIELD,
-                "user.fields": USER_FIELD,
-            },
+            params=_SPACE_PARAMS[bool(space_host)],
         )
         return Space(res, http_client=self)
 
@@ -634,11 +816,7 @@ class HTTPClient:
             "2",
             f"/lists/{id}",
             auth=True,
-            params={
-                "expansions": LIST_EXPANSION,
-                "list.fields": LIST_FIELD,
-                "user.fields": USER_FIELD,
-            },
+            params=LIST_PARAMS,
         )
         return TwitterList(res, http_client=self)
 
@@ -674,9 +852,8 @@ class HTTPClient:
             self.event_parser.parse_tweet_delete(payload)
 
     def fetch_direct_message(self, event_id: ID) -> Optional[DirectMessage]:
-        try:
-            event_id = str(event_id)
-        except ValueError:
+        event_id = str(event_id)
+        if not event_id.isdigit():
             raise ValueError("event_id must be an integer or a string of digits.")
 
         res = self.request("GET", "1.1", f"/direct_messages/events/show.json?id={event_id}", auth=True)
@@ -685,26 +862,20 @@ class HTTPClient:
         recipient_id = int(message_create.get("target").get("recipient_id"))
         sender_id = int(message_create.get("sender_id"))
 
-        recipient = self.user_cache.get(recipient_id)
-        sender = self.user_cache.get(sender_id)
-        if not recipient:
-            recipient = self.fetch_user(recipient_id)
+        users = {user_id: self.user_cache.get(user_id) for user_id in (recipient_id, sender_id)}
+        missing = [user_id for user_id, user in users.items() if user is None]
+        if missing:
+            users.update((user.id, user) for user in self.fetch_users(missing))
 
-        if not sender:
-            sender = self.fetch_user(sender_id)
-
-        res["event"]["message_create"]["target"]["recipient"] = recipient
-        res["event"]["message_create"]["target"]["sender"] = sender
+        res["event"]["message_create"]["target"]["recipient"] = users[recipient_id]
+        res["event"]["message_create"]["target"]["sender"] = users[sender_id]
         message = DirectMessage(res, http_client=self)
         self.message_cache[message.id] = message
-        self.message_cache[recipient_id] = recipient
-        self.message_cache[sender_id] = sender
         return message
 
     def fetch_welcome_message(self, welcome_message_id: ID) -> Optional[WelcomeMessage]:
-        try:
-            welcome_message_id = str(welcome_message_id)
-        except ValueError:
+        welcome_message_id = str(welcome_message_id)
+        if not welcome_message_id.isdigit():
             raise ValueError("welcome_message_id must be an integer or a string of digits.")
 
         res = self.request(
@@ -815,6 +986,11 @@ class HTTPClient:
         message_data = data["event"]["message_create"]["message_data"]
         message_data["text"] = str(text)
 
+        # The recipient is known upfront, so fetch it while the message is being uploaded and sent unless we have it.
+        recipient = self.user_cache.get(int(recipient_id))
+        if recipient is None:
+            user_future = executor.submit(self.fetch_user, recipient_id)
+
         if file:
             future = executor.submit(self.quick_upload, file)
 
@@ -832,10 +1008,7 @@ class HTTPClient:
 
         if file:
             file = future.result()
-            message_data["attachment"] = {}
-            message_data["attachment"]["type"] = "media"
-            message_data["attachment"]["media"] = {}
-            message_data["attachment"]["media"]["id"] = str(file.media_id)
+            message_data["attachment"] = {"type": "media", "media": {"id": str(file.media_id)}}
 
         res = self.request(
             "POST",
@@ -845,10 +1018,10 @@ class HTTPClient:
             auth=True,
         )
 
-        message_create = res.get("event").get("message_create")
-        user_id = message_create.get("target").get("recipient_id")
-        user = self.fetch_user(user_id)
-        res["event"]["message_create"]["target"]["recipient"] = user
+        if recipient is None:
+            recipient = user_future.result()
+
+        res["event"]["message_create"]["target"]["recipient"] = recipient
 
         msg = DirectMessage(res, http_client=self)
         self.message_cache[msg.id] = msg
@@ -877,28 +1050,23 @@ class HTTPClient:
         if text:
             payload["text"] = text
 
-        if file:
-            payload["media"] = {}
-            payload["media"]["media_ids"] = []
-            executor.submit(self.quick_upload, file)
+        media_files = ([file] if file else []) + (files or [])
+        if len(media_files) > 4:
+            raise BadRequests(message="Cannot upload more then 4 files!")
 
-        if files:
-            if len(files) + 1 if file else len(files) > 4:
-                raise BadRequests(message="Cannot upload more then 4 files!")
-
-            payload["media"] = {}
-            payload["media"]["media_ids"] = []
-            for file in files:
-                executor.submit(self.quick_upload, file)
+        if media_files:
+            payload["media"] = {"media_ids": []}
+            for media_file in media_files:
+                executor.submit(self.quick_upload, media_file)
 
         if poll:
-            payload["poll"] = {}
-            payload["poll"]["duration_minutes"] = int(poll.duration)
-            payload["poll"]["options"] = [option.label for option in poll.options]
+            payload["poll"] = {
+                "duration_minutes": int(poll.duration),
+                "options": [option.label for option in poll.options],
+            }
 
         if geo:
-            payload["geo"] = {}
-            payload["geo"]["place_id"] = geo.id if isinstance(geo, Geo) else geo
+            payload["geo"] = {"place_id": geo.id if isinstance(geo, Geo) else geo}
 
         if direct_message_deep_link:
             payload["direct_message_deep_link"] = direct_message_deep_link
@@ -909,10 +1077,9 @@ class HTTPClient:
             )
 
         if reply_tweet:
-            payload["reply"] = {}
-            payload["reply"]["in_reply_to_tweet_id"] = (
-                str(reply_tweet.id) if isinstance(reply_tweet, Tweet) else str(reply_tweet)
-            )
+            payload["reply"] = {
+                "in_reply_to_tweet_id": str(reply_tweet.id) if isinstance(reply_tweet, Tweet) else str(reply_tweet)
+            }
 
         if quote_tweet:
             payload["quote_tweet_id"] = str(quote_tweet.id) if isinstance(quote_tweet, Tweet) else str(quote_tweet)
@@ -920,14 +1087,10 @@ class HTTPClient:
         if exclude_reply_users:
             ids = [str(user.id) if isinstance(user, User) else str(user) for user in exclude_reply_users]
 
-            if "reply" in payload.keys():
-                payload["reply"]["exclude_reply_user_ids"] = ids
-            else:
-                payload["reply"] = {}
-                payload["reply"]["exclude_reply_user_ids"] = ids
+            payload.setdefault("reply", {})["exclude_reply_user_ids"] = ids
 
         if media_tagged_users:
-            if not payload.get("media"):
+            if not media_files:
                 raise PytweetException("Cannot tag users without any file!")
             payload["media"]["tagged_user_ids"] = [
                 str(user.id) if isinstance(user, (User, ClientAccount)) else str(user) for user in media_tagged_users
@@ -937,11 +1100,8 @@ class HTTPClient:
             payload["for_super_followers_only"] = True
 
         executor.wait_for_futures()
-        if file:
-            payload["media"]["media_ids"].append(str(file.media_id))
-        if files:
-            for file in files:
-                payload["media"]["media_ids"].append(str(file.media_id))
+        if media_files:
+            payload["media"]["media_ids"] = [str(media_file.media_id) for media_file in media_files]
 
         res = self.request("POST", "2", "/tweets", json=payload, auth=True)
         return self.fetch_tweet(res["data"]["id"])
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import datetime
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Optional
 
 from .type import ID, Payload
 from .utils import time_parse_todt
 from .paginations import UserPagination, TweetPagination
-from .constants import TWEET_EXPANSION, USER_FIELD, TWEET_FIELD, PINNED_TWEET_EXPANSION
+from .constants import (
+    TWEET_EXPANSION,
+    USER_FIELD,
+    TWEET_FIELD,
+    USER_PARAMS,
+)
 from .relations import RelationUpdate, RelationDelete, RelationPin
 from .objects import Comparable
 from .relations import RelationFollow
@@ -17,6 +23,10 @@ if TYPE_CHECKING:
 
 __all__ = ("List", "_CopyList")
 
+_LIST_TWEETS_PARAMS = MappingProxyType(
+    {"expansions": TWEET_EXPANSION, "user.fields": USER_FIELD, "tweet.fields": TWEET_FIELD}
+)
+
 
 class List(Comparable):
     """Represents a Twitter List object
@@ -26,13 +36,15 @@ class List(Comparable):
     .. versionadded:: 1.5.0
     """
 
-    __slots__ = ("__original_payload", "_payload", "http_client")
+    __slots__ = ("__original_payload", "_payload", "_id", "_owner", "http_client")
 
     def __init__(self, data: Payload, *, http_client: HTTPClient):
         self.__original_payload = data
         self._payload = self.__original_payload.get("data") or self.__original_payload
+        self._id = int(self._payload.get("id"))
+        self._owner = None
         self.http_client = http_client
-        super().__init__(self.id)
+        super().__init__(self._id)
 
     def __repr__(self) -> str:
         return "List(name={0.name} id={0.id} description={0.description} owner={0.owner!r})".format(self)
@@ -51,7 +63,7 @@ class List(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        return int(self._payload.get("id"))
+        return self._id
 
     @property
     def description(self) -> Optional[str]:
@@ -68,12 +80,13 @@ class List(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        from .user import User  # Avoid circular import error
+        if self._owner is None:
+            from .user import User  # Avoid circular import error
 
-        user_data = self.__original_payload.get("includes").get("users")
-        if user_data:
-            return User(user_data[0], http_client=self.http_client)
-        return None
+            user_data = (self.__original_payload.get("includes") or {}).get("users")
+            if user_data:
+                self._owner = User(user_data[0], http_client=self.http_client)
+        return self._owner
 
     @property
     def created_at(self) -> datetime.datetime:
@@ -126,7 +139,7 @@ class List(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         data = self.http_client.request(
             "POST", "2", f"/users/{my_id}/followed_lists", json={"list_id": str(self.id)}, auth=True
         )
@@ -143,7 +156,7 @@ class List(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         data = self.http_client.request("DELETE", "2", f"/users/{my_id}/followed_lists/{self.id}", auth=True)
         return RelationFollow(data)
 
@@ -158,11 +171,7 @@ class List(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        params = {
-            "expansions": PINNED_TWEET_EXPANSION,
-            "user.fields": USER_FIELD,
-            "tweet.fields": TWEET_FIELD,
-        }
+        params = USER_PARAMS
 
         res = self.http_client.request(
             "GET",
@@ -192,11 +201,7 @@ class List(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        params = {
-            "expansions": TWEET_EXPANSION,
-            "user.fields": USER_FIELD,
-            "tweet.fields": TWEET_FIELD,
-        }
+        params = _LIST_TWEETS_PARAMS
 
         res = self.http_client.request(
             "GET",
@@ -303,17 +308,14 @@ class List(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        executor = self.http_client.thread_manager.create_new_executor(thread_name="add-members-list-method")
-        for user in users:
-            executor.submit(
-                self.http_client.request,
-                "POST",
-                "2",
-                f"/lists/{self.id}/members",
-                json={"user_id": str(user.id)},
-                auth=True,
-            )
-        executor.wait_for_futures()
+        executor = self.http_client.fanout_executor
+        request = self.http_client.request
+        path = f"/lists/{self.id}/members"
+        futures = [
+            executor.submit(request, "POST", "2", path, json={"user_id": str(user.id)}, auth=True) for user in users
+        ]
+        for future in futures:
+            future.result()
 
     def remove_members(self, *users: User):
         """Removes members to the list.
@@ -330,27 +332,19 @@ class List(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        executor = self.http_client.thread_manager.create_new_executor(thread_name="remove-members-list-method")
-        for user in users:
-            executor.submit(
-                self.http_client.request,
-                "DELETE",
-                "2",
-                f"/lists/{self.id}/members/{user.id}",
-                auth=True,
-            )
-        executor.wait_for_futures()
+        executor = self.http_client.fanout_executor
+        request = self.http_client.request
+        path = f"/lists/{self.id}/members/"
+        futures = [executor.submit(request, "DELETE", "2", path + str(user.id), auth=True) for user in users]
+        for future in futures:
+            future.result()
 
     def fetch_members(self) -> Optional[UserPagination]:
         res = self.http_client.request(
             "GET",
             "2",
             f"/lists/{self.id}/members",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
             auth=True,
         )
         if not res:
@@ -360,11 +354,7 @@ class List(Comparable):
             res,
             endpoint_request=f"/lists/{self.id}/member",
             http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
         )
 
 
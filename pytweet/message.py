@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .dataclass import ApplicationInfo, InitiatedVia
@@ -16,6 +17,9 @@ if TYPE_CHECKING:
 
 __all__ = ("Message", "DirectMessage", "WelcomeMessage", "WelcomeMessageRule")
 
+_EMPTY = MappingProxyType({})  # Shared default when a message has no target or quick reply response.
+_MISSING = object()  # None is a valid cached attachment, so unbuilt ones are marked with this instead.
+
 
 class Message(Comparable):
     """Represents the base Message of all Message types in Twitter.
@@ -28,11 +32,11 @@ class Message(Comparable):
     def __init__(self, text: Optional[str], id: ID, type: int):
         super().__init__(id)
         self._text = text
-        self._id = id
-        self._type = type
+        self._id = int(id) if id is not None else None
+        self._type = MessageTypeEnum(type)
 
     def __repr__(self) -> str:
-        return "Message(text={0.text} id={0.id})".format(self)
+        return f"Message(text={self.text} id={self.id})"
 
     @property
     def text(self) -> str:
@@ -48,7 +52,7 @@ class Message(Comparable):
 
         .. versionadded:: 1.2.0
         """
-        return int(self._id)
+        return self._id
 
     @property
     def type(self) -> MessageTypeEnum:
@@ -56,7 +60,7 @@ class Message(Comparable):
 
         .. versionadded:: 1.2.0
         """
-        return MessageTypeEnum(self._type)
+        return self._type
 
 
 class DirectMessage(Message):
@@ -71,8 +75,16 @@ class DirectMessage(Message):
         "__message_create",
         "__message_data",
         "__entities",
-        "_quick_reply_data",
-        "_cta_data",
+        "_target",
+        "_initiated_via",
+        "_event_type",
+        "_created_at",
+        "_hashtags",
+        "_symbols",
+        "_mentions",
+        "_urls",
+        "_quick_reply",
+        "_cta",
         "http_client",
     )
 
@@ -82,14 +94,21 @@ class DirectMessage(Message):
         self.__message_create = self._payload.get("message_create", None)
         self.__message_data = self.__message_create.get("message_data", None)
         self.__entities = self.__message_data.get("entities", None)
+        self._target = self.__message_create.get("target") or _EMPTY
+        self._event_type = MessageEventTypeEnum(self._payload.get("type", None))
+        self._created_at = None
+        self._hashtags = None
+        self._symbols = None
+        self._mentions = None
+        self._urls = None
         self._initiated_via = self._payload.get("initiated_via")
-        self._quick_reply_data = self.__message_data.get("quick_reply")
-        self._cta_data = self.__message_data.get("ctas")
+        self._quick_reply = _MISSING
+        self._cta = _MISSING
         self.http_client = http_client
         super().__init__(self.__message_data.get("text"), self._payload.get("id"), 0)
 
     def __repr__(self) -> str:
-        return "DirectMessage(text={0.text} id={0.id} recipient={0.recipient})".format(self)
+        return f"DirectMessage(text={self.text} id={self.id} recipient={self.recipient})"
 
     @property
     def event_type(self) -> MessageEventTypeEnum:
@@ -97,7 +116,7 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.2.0
         """
-        return MessageEventTypeEnum(self._payload.get("type", None))
+        return self._event_type
 
     @property
     def recipient(self) -> User:
@@ -105,7 +124,7 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.2.0
         """
-        return self.__message_create.get("target", {}).get("recipient")
+        return self._target.get("recipient")
 
     @property
     def sender(self) -> Optional[User]:
@@ -113,7 +132,7 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.5.0
         """
-        return self.__message_create.get("target", {}).get("sender")
+        return self._target.get("sender")
 
     @property
     def author(self) -> Optional[User]:
@@ -129,7 +148,7 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.5.0
         """
-        return self.__message_create.get("target", {}).get("source_application", None)
+        return self._target.get("source_application")
 
     @property
     def created_at(self) -> datetime.datetime:
@@ -137,7 +156,9 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.2.0
         """
-        return datetime.datetime.fromtimestamp(int(self._payload.get("created_timestamp")) / 1000)
+        if self._created_at is None:
+            self._created_at = datetime.datetime.fromtimestamp(int(self._payload.get("created_timestamp")) / 1000)
+        return self._created_at
 
     @property
     def hashtags(self) -> Optional[List[Hashtag]]:
@@ -145,7 +166,9 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.2.0
         """
-        return [Hashtag(data) for data in self.__entities.get("hashtags")]
+        if self._hashtags is None:
+            self._hashtags = [Hashtag(data) for data in self.__entities.get("hashtags") or ()]
+        return self._hashtags
 
     @property
     def symbols(self) -> Optional[List[Symbol]]:
@@ -153,7 +176,9 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.2.0
         """
-        return [Symbol(data) for data in self.__entities.get("symbols")]
+        if self._symbols is None:
+            self._symbols = [Symbol(data) for data in self.__entities.get("symbols") or ()]
+        return self._symbols
 
     @property
     def mentions(self) -> Optional[List[UserMention]]:
@@ -161,7 +186,9 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.2.0
         """
-        return [UserMention(data) for data in self.__entities.get("user_mentions")]
+        if self._mentions is None:
+            self._mentions = [UserMention(data) for data in self.__entities.get("user_mentions") or ()]
+        return self._mentions
 
     @property
     def urls(self) -> Optional[List[Url]]:
@@ -169,7 +196,9 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.2.0
         """
-        return [Url(data) for data in self.__entities.get("urls")]
+        if self._urls is None:
+            self._urls = [Url(data) for data in self.__entities.get("urls") or ()]
+        return self._urls
 
     @property
     def quick_reply(self) -> Optional[QuickReply]:
@@ -177,12 +206,16 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.3.5
         """
-        if self._quick_reply_data and self._quick_reply_data.get("options"):
-            attachment = QuickReply(self._quick_reply_data.get("type"))
-            for option in self._quick_reply_data.get("options"):
-                attachment.add_option(**option)
-            return attachment
-        return None
+        if self._quick_reply is _MISSING:
+            attachment = None
+            quick_reply_data = self.__message_data.get("quick_reply")
+            options = quick_reply_data and quick_reply_data.get("options")
+            if options:
+                attachment = QuickReply(quick_reply_data.get("type"))
+                for option in options:
+                    attachment.add_option(**option)
+            self._quick_reply = attachment
+        return self._quick_reply
 
     @property
     def quick_reply_response(self) -> Optional[str]:
@@ -190,7 +223,7 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.5.0
         """
-        return self.__message_data.get("quick_reply_response", {}).get("metadata", None)
+        return self.__message_data.get("quick_reply_response", _EMPTY).get("metadata")
 
     @property
     def cta(self) -> Optional[CTA]:
@@ -198,12 +231,15 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.3.5
         """
-        if self._cta_data:
-            attachment = CTA()
-            for button in self._cta_data:
-                attachment.add_button(**button)
-            return attachment
-        return None
+        if self._cta is _MISSING:
+            attachment = None
+            cta_data = self.__message_data.get("ctas")
+            if cta_data:
+                attachment = CTA()
+                for button in cta_data:
+                    attachment.add_button(**button)
+            self._cta = attachment
+        return self._cta
 
     @property
     def initiated_via(self) -> Optional[InitiatedVia]:
@@ -234,10 +270,7 @@ class DirectMessage(Message):
             auth=True,
         )
 
-        try:
-            self.http_client.message_cache.pop(int(self.id))
-        except KeyError:
-            pass
+        self.http_client.message_cache.pop(self.id, None)
 
     def mark_as_read(self):
         """Mark the DirectMessage as read, it also mark other messages before the DirectMessage was sent as read.
@@ -263,7 +296,7 @@ class WelcomeMessage(Message):
     .. versionadded:: 1.3.5
     """
 
-    __slots__ = ("_name", "_timestamp", "http_client")
+    __slots__ = ("_name", "_timestamp", "_created_at", "http_client")
 
     def __init__(
         self,
@@ -277,10 +310,11 @@ class WelcomeMessage(Message):
         super().__init__(text, id, 2)
         self._name = name
         self._timestamp = timestamp
+        self._created_at = None
         self.http_client = http_client
 
     def __repr__(self) -> str:
-        return "WelcomeMessage(text={0.text} id={0.id})".format(self)
+        return f"WelcomeMessage(text={self.text} id={self.id})"
 
     @property
     def name(self) -> str:
@@ -296,18 +330,15 @@ class WelcomeMessage(Message):
 
         .. versionadded:: 1.3.5
         """
-        return datetime.datetime.fromtimestamp(int(self._timestamp) / 1000)
+        if self._created_at is None:
+            self._created_at = datetime.datetime.fromtimestamp(int(self._timestamp) / 1000)
+        return self._created_at
 
     def set_rule(self) -> WelcomeMessageRule:
         """Set a new Welcome Message Rule that determines which Welcome Message will be shown in a given conversation. Returns the created rule if successful.
 
         .. versionadded:: 1.3.5
         """
-        try:
-            int(self.id)
-        except Exception as e:
-            raise e
-
         data = {"welcome_message_rule": {"welcome_message_id": str(self.id)}}
 
         res = self.http_client.request(
@@ -318,8 +349,10 @@ class WelcomeMessage(Message):
             auth=True,
         )
 
-        args = [v for k, v in res.get("welcome_message_rule").items()]
-        return WelcomeMessageRule(args[0], args[2], args[1], http_client=self.http_client)
+        rule = res.get("welcome_message_rule")
+        return WelcomeMessageRule(
+            rule.get("id"), rule.get("welcome_message_id"), rule.get("created_timestamp"), http_client=self.http_client
+        )
 
     def update(
         self,
@@ -379,7 +412,7 @@ class WelcomeMessageRule(Message):
     .. versionadded:: 1.3.5
     """
 
-    __slots__ = ("_welcome_message_id", "_timestamp", "http_client")
+    __slots__ = ("_welcome_message_id", "_timestamp", "_created_at", "http_client")
 
     def __init__(
         self,
@@ -392,13 +425,13 @@ class WelcomeMessageRule(Message):
         super().__init__(None, id=id, type=3)
         self._welcome_message_id = welcome_message_id
         self._timestamp = timestamp
+        self._created_at = None
         self.http_client = http_client
 
     def __repr__(self) -> str:
         return (
-            "WelcomeMessageRule(id={0.id} welcome_message_id={0.welcome_message_id} created_at={0.created_at})".format(
-                self
-            )
+            f"WelcomeMessageRule(id={self.id} welcome_message_id={self.welcome_message_id} "
+            f"created_at={self.created_at})"
         )
 
     @property
@@ -415,7 +448,9 @@ class WelcomeMessageRule(Message):
 
         .. versionadded:: 1.3.5
         """
-        return datetime.datetime.fromtimestamp(int(self._timestamp) / 1000)
+        if self._created_at is None:
+            self._created_at = datetime.datetime.fromtimestamp(int(self._timestamp) / 1000)
+        return self._created_at
 
     def delete(self):
         """Delete the Welcome Message Rule.
@@ -9,6 +9,8 @@ class Comparable:
     .. versionadded:: 1.5.0
     """
 
+    __slots__ = ("o",)
+
     def __init__(self, o: object):
         self.o = o
 
@@ -48,7 +48,9 @@ class Pagination:
         self._count = 0
         self._paginate_over = 0
         self._current_page_number = 1
-        self._params = kwargs.get("params", None)
+        # Paginating writes the page token into the params, keep our own copy so shared params are never touched.
+        params = kwargs.get("params", None)
+        self._params = dict(params) if params is not None else None
         self.item_type = item_type
         self.endpoint_request = endpoint_request
         self.http_client = http_client
@@ -109,8 +111,8 @@ class Pagination:
         .. versionadded:: 1.5.0
         """
         fulldata = []
-        for page_number in self.pages_cache.keys():
-            fulldata.append(list(self.pages_cache.get(page_number).values()))
+        for page in self.pages_cache.values():
+            fulldata.append(list(page.values()))
         return zip(range(1, len(self.pages_cache) + 1), fulldata)
 
     def get_page_content(self, page_number: int) -> Optional[list]:
@@ -193,8 +195,9 @@ class UserPagination(Pagination):
         self._previous_token = self._meta.get("previous_token")
         self._count = 0
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {user.id: user for user in self.content}
+        content = self.content
+        if not previous_content[0] == content[0]:
+            self.pages_cache[len(self.pages_cache) + 1] = {user.id: user for user in content}
 
     def previous_page(self):
         """Change `content` property to the previous page's contents..
@@ -230,8 +233,9 @@ class UserPagination(Pagination):
         self._previous_token = self._meta.get("previous_token")
         self._count = 0
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {user.id: user for user in self.content}
+        content = self.content
+        if not previous_content[0] == content[0]:
+            self.pages_cache[len(self.pages_cache) + 1] = {user.id: user for user in content}
 
 
 class TweetPagination(Pagination):
@@ -290,14 +294,14 @@ class TweetPagination(Pagination):
         previous_content = self.content
         self._current_page_number += 1
         self.original_payload = res
-        self.payload = self.content
+        content = self.payload = self.content
         self._meta = self.original_payload.get("meta")
         self._next_token = self._meta.get("next_token")
         self._previous_token = self._meta.get("previous_token")
         self._count = 0
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {tweet.id: tweet for tweet in self.content}
+        if not previous_content[0] == content[0]:
+            self.pages_cache[len(self.pages_cache) + 1] = {tweet.id: tweet for tweet in content}
 
     def previous_page(self):
         """Change `content` property to the previous page's contents..
@@ -327,14 +331,14 @@ class TweetPagination(Pagination):
         previous_content = self.content
         self._current_page_number -= 1
         self.original_payload = res
-        self.payload = self.content
+        content = self.payload = self.content
         self._meta = self.original_payload.get("meta")
         self._next_token = self._meta.get("next_token")
         self._previous_token = self._meta.get("previous_token")
         self._count = 0
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {tweet.id: tweet for tweet in self.content}
+        if not previous_content[0] == content[0]:
+            self.pages_cache[len(self.pages_cache) + 1] = {tweet.id: tweet for tweet in content}
 
 
 class ListPagination(Pagination):
@@ -392,16 +396,14 @@ class ListPagination(Pagination):
         previous_content = self.content
         self._current_page_number += 1
         self.original_payload = res
-        self.payload = self.content
+        content = self.payload = self.content
         self._meta = self.original_payload.get("meta")
         self._next_token = self._meta.get("next_token")
         self._previous_token = self._meta.get("previous_token")
         self._count = 0
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {
-                _TwitterList.id: _TwitterList for _TwitterList in self.content
-            }
+        if not previous_content[0] == content[0]:
+            self.pages_cache[len(self.pages_cache) + 1] = {_TwitterList.id: _TwitterList for _TwitterList in content}
 
     def previous_page(self):
         """Change `content` property to the previous page's contents..
@@ -431,16 +433,14 @@ class ListPagination(Pagination):
         previous_content = self.content
         self._current_page_number -= 1
         self.original_payload = res
-        self.payload = self.content
+        content = self.payload = self.content
         self._meta = self.original_payload.get("meta")
         self._next_token = self._meta.get("next_token")
         self._previous_token = self._meta.get("previous_token")
         self._count = 0
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {
-                _TwitterList.id: _TwitterList for _TwitterList in self.content
-            }
+        if not previous_content[0] == content[0]:
+            self.pages_cache[len(self.pages_cache) + 1] = {_TwitterList.id: _TwitterList for _TwitterList in content}
 
 
 class MessagePagination(Pagination):
@@ -487,14 +487,15 @@ class MessagePagination(Pagination):
         previous_content = self.content
         self._current_page_number += 1
         self.original_payload = self.http_client.payload_parser.parse_message_to_pagination_data(res)
-        self.payload = self.content
+        self.payload = self.original_payload.get("data")
+        content = self.content
         self._meta = self.original_payload.get("meta")
         self._next_token = self._meta.get("next_token")
         self._previous_token = self._meta.get("previous_token")
         self._count = 0
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {message.id: message for message in self.content}
+        if not previous_content[0] == content[0]:
+            self.pages_cache[len(self.pages_cache) + 1] = {message.id: message for message in content}
 
     def previous_page(self):
         """Change `content` property to the previous page's contents..
@@ -524,11 +525,12 @@ class MessagePagination(Pagination):
         previous_content = self.content
         self._current_page_number -= 1
         self.original_payload = self.http_client.payload_parser.parse_message_to_pagination_data(res)
-        self.payload = self.content
+        self.payload = self.original_payload.get("data")
+        content = self.content
         self._meta = self.original_payload.get("meta")
         self._next_token = self._meta.get("next_token")
         self._previous_token = self._meta.get("previous_token")
         self._count = 0
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {message.id: message for message in self.content}
+        if not previous_content[0] == content[0]:
+            self.pages_cache[len(self.pages_cache) + 1] = {message.id: message for message in content}
@@ -40,12 +40,12 @@ class PayloadParser:
             "tweet_count": copy.get("statuses_count"),
             "listed_count": 0,
         }
-        if "created_timestamp" in copy.keys():
+        if "created_timestamp" in copy:
             copy["created_at"] = copy.get("created_timestamp")
-        if "screen_name" in copy.keys():
+        if "screen_name" in copy:
             copy["username"] = copy.get("screen_name")
 
-        if "profile_image_url_https" in copy.keys():
+        if "profile_image_url_https" in copy:
             copy["profile_image_url"] = copy.get("profile_image_url_https")
         return copy
 
@@ -61,10 +61,10 @@ class PayloadParser:
             user.get("screen_name") for user in payload.get("entities").get("user_mentions")
         ]
 
-        if "timestamp_ms" in payload.keys():
+        if "timestamp_ms" in payload:
             payload["timestamp"] = payload.get("timestamp_ms")
 
-        if "user" in payload.keys():
+        if "user" in payload:
             payload["includes"]["users"] = [self.parse_user_payload(payload.get("user"))]
 
         return payload
@@ -114,29 +114,33 @@ class PayloadParser:
         else:
             events = data["data"]
 
-        ids = []
+        ids = set()
         for event_data in events:
             message_create = event_data["message_create"]
-            ids.append(message_create["target"]["recipient_id"])
-            ids.append(message_create["sender_id"])
-        users = self.http_client.fetch_users(ids)
+            ids.add(message_create["target"]["recipient_id"])
+            ids.add(message_create["sender_id"])
+        users = {user.id: user for user in self.http_client.fetch_users(list(ids))} if ids else {}
+
+        apps = {}
+        if data.get("apps"):
+            for app_data in data["apps"].values():
+                app = ApplicationInfo(**app_data)
+                apps[int(app.id)] = app
 
         for event_data in events:
             message_create = event_data["message_create"]
-            for user in users:
-                if user.id == int(message_create["target"]["recipient_id"]):
-                    message_create["target"]["recipient"] = user
-
-                if user.id == int(message_create["sender_id"]):
-                    message_create["target"]["sender"] = user
-
-            if data.get("apps"):
-                for app in [ApplicationInfo(**data) for data in list(data.get("apps").values())]:
-                    if app.id == int(message_create.get("source_app_id", 0)):
-                        message_create["target"]["source_application"] = app
-
-                    if app.id == int(message_create.get("source_app_id", 0)):
-                        message_create["target"]["source_application"] = app
+            target = message_create["target"]
+            recipient = users.get(int(target["recipient_id"]))
+            sender = users.get(int(message_create["sender_id"]))
+            if recipient:
+                target["recipient"] = recipient
+
+            if sender:
+                target["sender"] = sender
+
+            app = apps.get(int(message_create.get("source_app_id", 0)))
+            if app:
+                target["source_application"] = app
         return data
 
     def parse_embed_data(self, payload: Payload) -> Payload:
@@ -158,10 +162,8 @@ class EventParser:
     def __init__(self, http_client: HTTPClient):
         self.payload_parser = PayloadParser(http_client)
         self.http_client = http_client
-        try:
-            self.client_id = int(self.http_client.access_token.partition("-")[0])
-        except AttributeError:
-            self.client_id = int(self.http_client.fetch_me().id)
+        my_id = self.http_client.my_id
+        self.client_id = int(my_id) if my_id is not None else int(self.http_client.fetch_me().id)
 
     def parse_direct_message_create(self, direct_message_payload: Payload):
         event_payload = {"event": direct_message_payload.get("direct_message_events")[0]}
@@ -181,7 +183,7 @@ class EventParser:
         )
         application_info = direct_message_payload.get("apps")
         if application_info:
-            source_app_id = list(application_info.keys())[0]
+            source_app_id = next(iter(application_info))
             source_app = ApplicationInfo(**application_info.get(source_app_id))
 
         else:
@@ -315,18 +317,13 @@ class EventParser:
     def parse_tweet_delete(self, tweet_payload: Payload):
         event_payload = tweet_payload.get("tweet_delete_events")[0]
         tweet_id = event_payload.get("status").get("id")
-        tweet = self.http_client.tweet_cache.get(int(tweet_id))
+        tweet = self.http_client.tweet_cache.pop(int(tweet_id), None)
         if not tweet:
             message = Message(None, tweet_id, 1)
             return self.http_client.dispatch("tweet_delete", message)
 
-        try:
-            self.http_client.tweet_cache.pop(int(tweet_id))
-        except KeyError:
-            pass
-        finally:
-            tweet.deleted_timestamp = int(event_payload.get("timestamp_ms"))
-            self.http_client.dispatch("tweet_delete", tweet)
+        tweet.deleted_timestamp = int(event_payload.get("timestamp_ms"))
+        self.http_client.dispatch("tweet_delete", tweet)
 
     def parse_favorite_tweet(self, favorite_payload: Payload):
         action_payload = favorite_payload.copy()
@@ -7,14 +7,7 @@ from .user import User
 from .tweet import Tweet
 from .objects import Comparable
 from .dataclass import Topic
-from .constants import (
-    TWEET_EXPANSION,
-    USER_FIELD,
-    MEDIA_FIELD,
-    PLACE_FIELD,
-    POLL_FIELD,
-    TWEET_FIELD,
-)
+from .constants import TWEET_PARAMS
 
 __all__ = ("Space",)
 
@@ -25,7 +18,7 @@ class Space(Comparable):
     .. versionadded:: 1.3.5
     """
 
-    __slots__ = ("__original_payload", "_payload", "http_client", "_include")
+    __slots__ = ("__original_payload", "_payload", "http_client", "_includes")
 
     def __init__(self, data: Dict[str, Any], http_client: object):
         self.__original_payload = data
@@ -213,14 +206,7 @@ class Space(Comparable):
             "GET",
             "2",
             f"/spaces/{self.id}/tweets",
-            params={
-                "expansions": TWEET_EXPANSION,
-                "tweet.fields": TWEET_FIELD,
-                "user.fields": USER_FIELD,
-                "media.fields": MEDIA_FIELD,
-                "place.fields": PLACE_FIELD,
-                "poll.fields": POLL_FIELD,
-            },
+            params=TWEET_PARAMS,
         )
 
         if not res or not res.get("data"):
@@ -243,14 +229,7 @@ class Space(Comparable):
             "GET",
             "2",
             f"/spaces/{self.id}/buyers",
-            params={
-                "expansions": TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "media.fields": MEDIA_FIELD,
-                "place.fields": PLACE_FIELD,
-                "poll.fields": POLL_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=TWEET_PARAMS,
         )
         if not res:
             return []
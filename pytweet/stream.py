@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import requests
 import logging
 import time
@@ -8,21 +7,17 @@ import time
 from typing import TYPE_CHECKING, Any, List, Type, Optional
 from .dataclass import StreamRule
 from .errors import ConnectionException, PytweetException
-from .constants import (
-    MEDIA_FIELD,
-    PLACE_FIELD,
-    POLL_FIELD,
-    TWEET_EXPANSION,
-    TWEET_FIELD,
-    USER_FIELD,
-)
+from .constants import TWEET_PARAMS
 from .tweet import Tweet
+from .utils import load_json
 
 
 if TYPE_CHECKING:
     from .http import HTTPClient
 
 _log = logging.getLogger(__name__)
+# Twitter sends a keep-alive every 20 seconds, a silent connection for longer than this is stalled and is reconnected.
+_STREAM_READ_TIMEOUT = 90
 
 
 class StreamConnection:
@@ -102,21 +97,16 @@ class StreamConnection:
         """
         self.running = True
         http = self.http_client
+        headers = {"Authorization": f"Bearer {http.bearer_token}"}
+        params = {"backfill_minutes": int(self.backfill_minutes), **TWEET_PARAMS}
         while self.running:
             try:
                 response = requests.get(
                     self.url,
-                    headers={"Authorization": f"Bearer {http.bearer_token}"},
-                    params={
-                        "backfill_minutes": int(self.backfill_minutes),
-                        "expansions": TWEET_EXPANSION,
-                        "media.fields": MEDIA_FIELD,
-                        "place.fields": PLACE_FIELD,
-                        "poll.fields": POLL_FIELD,
-                        "tweet.fields": TWEET_FIELD,
-                        "user.fields": USER_FIELD,
-                    },
+                    headers=headers,
+                    params=params,
                     stream=True,
+                    timeout=(http.timeout[0], _STREAM_READ_TIMEOUT),
                 )
                 _log.info("Client connected to stream!")
                 http.dispatch("stream_connect", self)
@@ -124,8 +114,8 @@ class StreamConnection:
 
                 for response_line in response.iter_lines():
                     if response_line:
-                        json_data = json.loads(response_line.decode("UTF-8"))
-                        if "errors" in json_data.keys():
+                        json_data = load_json(response_line)
+                        if "errors" in json_data:
                             raise ConnectionException(self.session, None)
                         tweet = Tweet(json_data, http_client=http)
                         http.tweet_cache[tweet.id] = tweet
@@ -1,19 +1,12 @@
 from __future__ import annotations
 
 import datetime
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from .attachments import Poll, Geo, File, Media
 from .enums import ReplySetting
-from .constants import (
-    TWEET_EXPANSION,
-    TWEET_FIELD,
-    USER_FIELD,
-    PINNED_TWEET_EXPANSION,
-    MEDIA_FIELD,
-    PLACE_FIELD,
-    POLL_FIELD,
-)
+from .constants import TWEET_PARAMS, USER_PARAMS
 from .relations import RelationHide, RelationLike, RelationRetweet, RelationDelete
 from .user import User
 from .utils import time_parse_todt, convert
@@ -34,6 +27,8 @@ if TYPE_CHECKING:
 
 __all__ = ("Tweet",)
 
+_QUOTE_TWEETS_PARAMS = MappingProxyType({**TWEET_PARAMS, "max_results": 100})
+
 
 class Tweet(Message):
     """Represents a tweet message from Twitter.
@@ -61,6 +56,9 @@ class Tweet(Message):
         "__original_payload",
         "_payload",
         "_includes",
+        "_referenced_tweets",
+        "_entities",
+        "_embeds",
         "tweet_metrics",
         "http_client",
         "deleted_timestamp",
@@ -416,7 +414,7 @@ class Tweet(Message):
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         res = self.http_client.request("POST", "2", f"/users/{my_id}/likes", json={"tweet_id": str(self.id)}, auth=True)
         return RelationLike(res)
 
@@ -431,7 +429,7 @@ class Tweet(Message):
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
 
         res = self.http_client.request("DELETE", "2", f"/users/{my_id}/likes/{self.id}", auth=True)
 
@@ -448,7 +446,7 @@ class Tweet(Message):
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         res = self.http_client.request(
             "POST",
             "2",
@@ -470,7 +468,7 @@ class Tweet(Message):
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
 
         res = self.http_client.request("DELETE", "2", f"/users/{my_id}/retweets/{self.id}", auth=True)
 
@@ -486,10 +484,7 @@ class Tweet(Message):
         """
         res = self.http_client.request("DELETE", "2", f"/tweets/{self.id}", auth=True)
 
-        try:
-            self.http_client.tweet_cache.pop(self.id)
-        except KeyError:
-            pass
+        self.http_client.tweet_cache.pop(self.id, None)
 
         return RelationDelete(res)
 
@@ -592,11 +587,7 @@ class Tweet(Message):
             "GET",
             "2",
             f"/tweets/{self.id}/retweeted_by",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
         )
         if not res:
             return []
@@ -605,11 +596,7 @@ class Tweet(Message):
             res,
             endpoint_request=f"/tweets/{self.id}/retweeted_by",
             http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
         )
 
     def fetch_likers(self) -> Optional[UserPagination]:
@@ -627,11 +614,7 @@ class Tweet(Message):
             "GET",
             "2",
             f"/tweets/{self.id}/liking_users",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
         )
 
         if not res:
@@ -641,11 +624,7 @@ class Tweet(Message):
             res,
             endpoint_request=f"/tweets/{self.id}/liking_users",
             http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
         )
 
     def fetch_quoted_tweets(self) -> Optional[TweetPagination]:
@@ -659,15 +638,7 @@ class Tweet(Message):
 
         .. versionadded:: 1.5.0
         """
-        params = {
-            "expansions": TWEET_EXPANSION,
-            "user.fields": USER_FIELD,
-            "tweet.fields": TWEET_FIELD,
-            "media.fields": MEDIA_FIELD,
-            "place.fields": PLACE_FIELD,
-            "poll.fields": POLL_FIELD,
-            "max_results": 100,
-        }
+        params = _QUOTE_TWEETS_PARAMS
 
         res = self.http_client.request("GET", "2", f"/tweets/{self.id}/quote_tweets", params=params)
 
@@ -5,15 +5,10 @@ import datetime
 from typing import TYPE_CHECKING, Any, Dict, Optional, Union, List
 
 from .constants import (
-    TWEET_EXPANSION,
-    LIST_EXPANSION,
     PINNED_TWEET_EXPANSION,
-    MEDIA_FIELD,
-    PLACE_FIELD,
-    POLL_FIELD,
-    TWEET_FIELD,
-    USER_FIELD,
-    LIST_FIELD,
+    USER_PARAMS,
+    TWEET_PARAMS,
+    LIST_PARAMS,
 )
 from .relations import RelationFollow
 from .utils import time_parse_todt, convert
@@ -294,7 +289,7 @@ class User(Comparable):
 
         .. versionadded:: 1.1.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         res = self.http_client.request(
             "POST",
             "2",
@@ -302,6 +297,7 @@ class User(Comparable):
             json={"target_user_id": str(self.id)},
             auth=True,
         )
+        self.http_client.invalidate_user(self.id)
         return RelationFollow(res)
 
     def unfollow(self) -> RelationFollow:
@@ -315,8 +311,9 @@ class User(Comparable):
 
         .. versionadded:: 1.1.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         res = self.http_client.request("DELETE", "2", f"/users/{my_id}/following/{self.id}", auth=True)
+        self.http_client.invalidate_user(self.id)
         return RelationFollow(res)
 
     def block(self) -> None:
@@ -324,7 +321,7 @@ class User(Comparable):
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         self.http_client.request(
             "POST",
             "2",
@@ -332,21 +329,23 @@ class User(Comparable):
             json={"target_user_id": str(self.id)},
             auth=True,
         )
+        self.http_client.invalidate_user(self.id)
 
     def unblock(self) -> None:
         """Unblocks the user.
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         self.http_client.request("DELETE", "2", f"/users/{my_id}/blocking/{self.id}", auth=True)
+        self.http_client.invalidate_user(self.id)
 
     def mute(self) -> None:
         """Mutes the user.
 
         .. versionadded:: 1.2.5
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         self.http_client.request(
             "POST",
             "2",
@@ -360,7 +359,7 @@ class User(Comparable):
 
         .. versionadded:: 1.2.5
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         self.http_client.request("DELETE", "2", f"/users/{my_id}/muting/{self.id}", auth=True)
 
     def report(self, *, block: bool = True):
@@ -409,11 +408,7 @@ class User(Comparable):
             "GET",
             "2",
             f"/users/{self.id}/followers",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
         )
 
         if not following:
@@ -423,11 +418,7 @@ class User(Comparable):
             following,
             endpoint_request=f"/users/{self.id}/followers",
             http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
         )
 
     def fetch_following(self) -> Optional[UserPagination]:
@@ -445,11 +436,7 @@ class User(Comparable):
             "GET",
             "2",
             f"/users/{self.id}/following",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
         )
 
         if not following:
@@ -459,11 +446,7 @@ class User(Comparable):
             following,
             endpoint_request=f"/users/{self.id}/following",
             http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
         )
 
     def fetch_timelines(
@@ -509,14 +492,7 @@ class User(Comparable):
         ):
             raise ValueError("start_time or end_time must be a datetime object!")
 
-        params = {
-            "expansions": TWEET_EXPANSION,
-            "user.fields": USER_FIELD,
-            "media.fields": MEDIA_FIELD,
-            "place.fields": PLACE_FIELD,
-            "poll.fields": POLL_FIELD,
-            "tweet.fields": TWEET_FIELD,
-        }
+        params = dict(TWEET_PARAMS)
 
         if start_time:
             params["start_time"] = start_time.isoformat()
@@ -550,14 +526,7 @@ class User(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        params = {
-            "expansions": TWEET_EXPANSION,
-            "user.fields": USER_FIELD,
-            "media.fields": MEDIA_FIELD,
-            "place.fields": PLACE_FIELD,
-            "poll.fields": POLL_FIELD,
-            "tweet.fields": TWEET_FIELD,
-        }
+        params = TWEET_PARAMS
 
         res = self.http_client.request(
             "GET",
@@ -600,11 +569,7 @@ class User(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        params = {
-            "expansions": LIST_EXPANSION,
-            "list.fields": LIST_FIELD,
-            "user.fields": USER_FIELD,
-        }
+        params = LIST_PARAMS
 
         res = self.http_client.request("GET", "2", f"/users/{self.id}/owned_lists", params=params)
 
@@ -634,11 +599,7 @@ class User(Comparable):
             "2",
             f"/users/{self.id}/pinned_lists",
             auth=True,
-            params={
-                "expansions": LIST_EXPANSION,
-                "user.fields": USER_FIELD,
-                "list.fields": LIST_FIELD,
-            },
+            params=LIST_PARAMS,
         )
         if not res:
             return None
@@ -659,11 +620,7 @@ class User(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        params = {
-            "expansions": LIST_EXPANSION,
-            "list.fields": LIST_FIELD,
-            "user.fields": USER_FIELD,
-        }
+        params = LIST_PARAMS
 
         res = self.http_client.request("GET", "2", f"/users/{self.id}/list_memberships", params=params)
 
@@ -683,11 +640,7 @@ class User(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        params = {
-            "expansions": LIST_EXPANSION,
-            "list.fields": LIST_FIELD,
-            "user.fields": USER_FIELD,
-        }
+        params = LIST_PARAMS
 
         res = self.http_client.request("GET", "2", f"/users/{self.id}/followed_lists", params=params)
 
@@ -938,11 +891,7 @@ class ClientAccount(User):
             "GET",
             "2",
             f"/users/{self.id}/blocking",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
             auth=True,
         )
 
@@ -953,11 +902,7 @@ class ClientAccount(User):
             blockers,
             endpoint_request=f"/users/{self.id}/blocking",
             http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
         )
 
     def fetch_muters(self) -> Optional[UserPagination]:
@@ -975,11 +920,7 @@ class ClientAccount(User):
             "GET",
             "2",
             f"/users/{self.id}/muting",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
             auth=True,
         )
 
@@ -990,23 +931,12 @@ class ClientAccount(User):
             muters,
             endpoint_request=f"/users/{self.id}/muting",
             http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=USER_PARAMS,
         )
 
     def fetch_bookmarks(self) -> Optional[TweetPagination]:
         """"""
-        params = {
-            "expansions": TWEET_EXPANSION,
-            "user.fields": USER_FIELD,
-            "tweet.fields": TWEET_FIELD,
-            "media.fields": MEDIA_FIELD,
-            "place.fields": PLACE_FIELD,
-            "poll.fields": POLL_FIELD,
-        }
+        params = TWEET_PARAMS
 
         tweets = self.http_client.request(
             "GET",
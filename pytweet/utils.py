@@ -1,13 +1,35 @@
 from __future__ import annotations
 
 import datetime
-from typing import Any, Optional, TYPE_CHECKING
+import json
+from typing import Any, Optional, Union, TYPE_CHECKING
 from dateutil import parser
 
+try:
+    import orjson
+except ImportError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
 if TYPE_CHECKING:
     from .type import ID
 
 
+def load_json(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document, using orjson if it's installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(obj: Any) -> Union[str, bytes]:
+    """Encode an object to JSON, using orjson if it's installed. Returns bytes with orjson and str without it."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj)
+
+
 def convert(o: object, annotations: Any):
     try:
         return annotations(o)
@@ -23,6 +23,7 @@ extras_require = {
         "sphinx_copybutton>=0.4.0",
     ],
     "events": ["Flask>=2.0.2"],
+    "speed": ["orjson>=3.6.0"],
 }
 
 classifiers = [
@@ -0,0 +1,57 @@
+import io
+from unittest import mock
+
+import pytest
+import urllib3
+
+from pytweet.errors import TooManyRequests
+from pytweet.http import HTTPClient
+from pytweet.list import List as TwitterList
+
+
+def make_http_client(**kwargs):
+    return HTTPClient(
+        "bearer",
+        consumer_key="key",
+        consumer_secret="secret",
+        access_token="42-token",
+        access_token_secret="token-secret",
+        **kwargs,
+    )
+
+
+def test_ratelimit_with_retry_after_raises_without_sleeping():
+    http = make_http_client(sleep_after_ratelimit=False)
+    responses = []
+
+    def make_request(pool, conn, method, url, **kwargs):
+        response = urllib3.HTTPResponse(
+            body=io.BytesIO(b'{"title": "Too Many Requests", "detail": "Too Many Requests"}'),
+            status=429,
+            headers={"Retry-After": "1", "Content-Type": "application/json"},
+            preload_content=False,
+        )
+        responses.append(response)
+        return response
+
+    with mock.patch.object(urllib3.connectionpool.HTTPConnectionPool, "_make_request", make_request), mock.patch(
+        "time.sleep"
+    ) as sleep:
+        with pytest.raises(TooManyRequests):
+            http.request("GET", "2", "/users/me")
+
+    assert len(responses) == 1
+    sleep.assert_not_called()
+    http.close()
+
+
+def test_list_members_can_be_added_after_close():
+    http = make_http_client()
+    twitter_list = TwitterList({"data": {"id": "1", "name": "list"}}, http_client=http)
+    http.close()
+
+    with mock.patch.object(HTTPClient, "request", return_value={"data": {"is_member": True}}) as request:
+        twitter_list.add_members(mock.Mock(id=2), mock.Mock(id=3))
+
+    assert request.call_count == 2
+    http.close()